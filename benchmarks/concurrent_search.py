@@ -0,0 +1,135 @@
+"""
+Measures search throughput on one shared filing as threads are added
+
+Three ways of serving lookups from many threads are compared:
+
+  snapshot       XBRLSnapshot.search() from a frozen parser, with no lock
+  locked parser  XBRLParser.search() behind a global lock (a fact index
+                 lookup, falling back to XPath for facts not in the index)
+  locked xpath   the lookup XBRLParser.search() made before the fact index
+                 existed: an XPath query on the shared lxml tree, behind a
+                 global lock, which is what callers had to do before
+                 snapshots existed
+
+The queries are every numeric fact in the filing plus, for every fifth
+fact, the same concept in a context that does not exist (the kind of miss
+an XPath lookup has to scan the whole document for).
+
+Note that on a standard (GIL) CPython build, pure-Python lookups cannot run
+in parallel, so snapshot throughput stays roughly flat as threads are added;
+it only scales with threads on a free-threaded build. The locked columns
+cannot scale on either. Most of the snapshot's advantage over the locked
+xpath column comes from replacing XPath queries with dictionary lookups.
+
+Usage (with deltafy_xbrl installed):
+    python benchmarks/concurrent_search.py xyz-20170101.xml [threads ...]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from deltafy_xbrl.parse import XBRLParser
+import decimal
+import sys
+import threading
+import time
+
+SECONDS_PER_RUN = 2.0
+
+
+def xpath_search(parser, concept, context):
+    """
+    Looks up a concept value the way XBRLParser.search() did before the
+    fact index existed
+    """
+    xpath_query = "//{concept}[@contextRef='{context}']".format(
+        concept=concept,
+        context=context,
+    )
+    results = parser.instance_root.xpath(xpath_query, namespaces=parser.ns)
+
+    if len(results):
+        node = results[0]
+        nil_attribute = '{{{xsi}}}nil'.format(xsi=parser.ns.get('xsi'))
+        if node.attrib.get(nil_attribute) == 'true':
+            return decimal.Decimal('0')
+        elif node.text:
+            return decimal.Decimal(node.text)
+
+    return None
+
+
+def build_queries(snapshot):
+    """
+    Returns (prefixed concept, context) pairs for every indexed fact, with a
+    missing-context query added for every fifth fact
+    """
+    prefixes = {
+        namespace: prefix for prefix, namespace in snapshot.namespaces.items()
+    }
+    queries = []
+    for i, (tag, context) in enumerate(snapshot.facts):
+        namespace, _, localname = tag[1:].partition('}')
+        if namespace not in prefixes:
+            continue
+        concept = '{0}:{1}'.format(prefixes[namespace], localname)
+        queries.append((concept, context))
+        if i % 5 == 0:
+            queries.append((concept, context + '_missing'))
+    return queries
+
+
+def run(search, queries, threads):
+    """
+    Returns queries per second for `threads` workers calling search()
+    """
+    deadline = time.perf_counter() + SECONDS_PER_RUN
+
+    def worker():
+        count = 0
+        n = len(queries)
+        while time.perf_counter() < deadline:
+            for concept, context in queries[count % n:count % n + 100]:
+                search(concept, context)
+                count += 1
+        return count
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(worker) for _ in range(threads)]
+        total = sum(future.result() for future in futures)
+    elapsed = time.perf_counter() - start
+
+    return total / elapsed
+
+
+def main(instance_file_path, thread_counts):
+    parser = XBRLParser(instance_file_path=instance_file_path)
+    snapshot = parser.freeze()
+    queries = build_queries(snapshot)
+    lock = threading.Lock()
+
+    def locked_search(concept, context):
+        with lock:
+            return parser.search(concept, context)
+
+    def locked_xpath_search(concept, context):
+        with lock:
+            return xpath_search(parser, concept, context)
+
+    print("{0} queries ({1} facts in the index)".format(
+        len(queries), len(snapshot.facts)
+    ))
+    print("{0:>8} {1:>16} {2:>16} {3:>16}".format(
+        "threads", "snapshot q/s", "locked parser", "locked xpath"
+    ))
+    for threads in thread_counts:
+        print("{0:>8} {1:>16,.0f} {2:>16,.0f} {3:>16,.0f}".format(
+            threads,
+            run(snapshot.search, queries, threads),
+            run(locked_search, queries, threads),
+            run(locked_xpath_search, queries, threads),
+        ))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    main(sys.argv[1], [int(n) for n in sys.argv[2:]] or [1, 2, 4, 8])
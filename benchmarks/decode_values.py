@@ -0,0 +1,81 @@
+"""
+Compares the fact value decoders used by each XBRLParser value_mode
+
+The sample mimics a typical 10-K: mostly monetary values rounded to
+thousands or millions (decimals='-3', '-6'), some share counts
+(decimals='0') and some per-share amounts (decimals='2').
+
+Two timings are reported per decoder: decoding every value, and summing the
+decoded values that share decimals='-3' (for scaled_int, facts with the same
+'decimals' share an exponent, so only the mantissas are added).
+
+Usage (with deltafy_xbrl installed):
+    python benchmarks/decode_values.py [number of values]
+"""
+from deltafy_xbrl.tools import decode_decimal, decode_float, decode_scaled_int
+import random
+import sys
+import timeit
+
+
+def sample_values(count):
+    """
+    Returns a list of (value_string, decimals) pairs
+    """
+    rng = random.Random(0)
+    values = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.5:
+            values.append((str(rng.randint(-10 ** 7, 10 ** 8) * 1000), '-3'))
+        elif kind < 0.8:
+            values.append((str(rng.randint(-10 ** 4, 10 ** 5) * 10 ** 6), '-6'))
+        elif kind < 0.9:
+            values.append((str(rng.randint(0, 10 ** 9)), '0'))
+        else:
+            values.append((
+                '{0}.{1:02d}'.format(rng.randint(-20, 20), rng.randint(0, 99)),
+                '2'
+            ))
+    return values
+
+
+def sum_values(decoded):
+    """
+    Adds up decoded values, which all share the same 'decimals'
+    """
+    if decoded and isinstance(decoded[0], tuple):
+        return sum([mantissa for mantissa, exponent in decoded])
+    return sum(decoded)
+
+
+def main(count):
+    values = sample_values(count)
+    thousands = [value for value in values if value[1] == '-3']
+    decoders = [decode_decimal, decode_float, decode_scaled_int]
+    decode_timings = {decoder.__name__: [] for decoder in decoders}
+    sum_timings = {decoder.__name__: [] for decoder in decoders}
+
+    # Interleave the runs so that machine noise hits every decoder alike
+    for _ in range(20):
+        for decoder in decoders:
+            decode_timings[decoder.__name__].append(timeit.timeit(
+                lambda: [decoder(text, precision) for text, precision in values],
+                number=1,
+            ))
+            decoded = [decoder(text, precision) for text, precision in thousands]
+            sum_timings[decoder.__name__].append(timeit.timeit(
+                lambda: sum_values(decoded),
+                number=1,
+            ))
+
+    print("{0:>18} {1:>12} {2:>12}".format("decoder", "decode (s)", "sum (s)"))
+    for decoder in decoders:
+        name = decoder.__name__
+        print("{0:>18} {1:>12.5f} {2:>12.5f}".format(
+            name, min(decode_timings[name]), min(sum_timings[name])
+        ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -1,14 +1,22 @@
+from deltafy_xbrl.snapshot import Context, XBRLSnapshot
 from deltafy_xbrl.tools import *
 from datetime import datetime, timedelta
 from lxml import etree
 import decimal
 
+# Fact value decoders, keyed by XBRLParser value_mode
+VALUE_DECODERS = {
+    'decimal': decode_decimal,
+    'float': decode_float,
+    'scaled_int': decode_scaled_int,
+}
+
 
 class XBRLParser(object):
     """
     Deltafy XBRL parser client
     """
-    def __init__(self, instance_file_path=None):
+    def __init__(self, instance_file_path=None, value_mode='decimal'):
         """
         Initializes the XBRL Parser client
 
@@ -16,7 +24,22 @@ class XBRLParser(object):
         the basic fields and contexts that are necessary to examine the filing.
 
         Currently loads only the current period's instant and duration contexts.
+
+        value_mode selects how numeric fact values are decoded: 'decimal'
+        (decimal.Decimal), 'float', or 'scaled_int' (an integer mantissa and
+        power-of-ten exponent pair, with the exponent derived from the fact's
+        'decimals' attribute). Numeric facts are decoded into the fact index
+        the first time search() or freeze() is called, not while loading.
         """
+        if value_mode not in VALUE_DECODERS:
+            raise ValueError(
+                "value_mode must be one of: {0}".format(
+                    ", ".join(sorted(VALUE_DECODERS))
+                )
+            )
+
+        self.value_mode = value_mode
+        self.facts = None
         self.amendment_flag = None
         self.fiscal_year_end = None
         self.fiscal_period_focus = None
@@ -165,6 +188,55 @@ class XBRLParser(object):
             elif 'TradingSymbol' in node.tag:
                 self.trading_symbols= [x for x in node.text.split(", ")]
 
+    def index_facts(self):
+        """
+        Decodes every numeric fact in the filing into the fact index
+
+        Called on the first search() or freeze(), so that callers who only
+        need the DEI fields never pay for decoding.
+
+        Numeric facts (those with a unitRef) are keyed by namespaced tag
+        ('{namespace}localname') and contextRef. Values are decoded in a single
+        pass according to value_mode, so searching for a numeric fact is a
+        dictionary lookup.
+
+        Only the first fact for each key is considered, matching what search()
+        returns. If that fact is not numeric, has no plain text value (e.g. a
+        fraction item with numerator/denominator children) or its value cannot
+        be decoded, the key is left out of the index and search() queries the instance
+        document for it instead, just as it did before the index existed.
+        """
+        decode = VALUE_DECODERS[self.value_mode]
+        nil_attribute = '{{{xsi}}}nil'.format(xsi=self.ns.get('xsi'))
+        facts = {}
+        seen = set()
+
+        for node in self.instance_root.iter(etree.Element):
+            attrib = node.attrib
+            if 'contextRef' not in attrib:
+                continue
+
+            key = (node.tag, attrib['contextRef'])
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if 'unitRef' not in attrib:
+                continue
+
+            text = node.text
+            if attrib.get(nil_attribute) == 'true':
+                facts[key] = decode('0', None)
+            elif len(node) or not text or text.isspace():
+                continue
+            else:
+                try:
+                    facts[key] = decode(text, attrib.get('decimals'))
+                except (ArithmeticError, ValueError):
+                    continue
+
+        self.facts = facts
+
     def get_balance_sheet_date(self):
         """
         Assigns a filing's balance sheet date to the parser instance
@@ -447,21 +519,32 @@ class XBRLParser(object):
 
         Python decimal.Decimal types are preferred here over other types to 
         maintain the precision in the concept value. Hence, even integers
-        are returned as decimal.Decimal type.
+        are returned as decimal.Decimal type. Parsers created with a different
+        value_mode return float or (mantissa, exponent) values instead.
 
         If the xsi:nil attribute is present and set to 'true', the value is nil, 
         which is interpreted here to mean 0.
 
+        Numeric facts are answered from the fact index built at load time; the
+        instance document is only queried for concepts missing from the index.
+
         :param concept: a prefixed accounting concept (e.g. us-gaap:Cash)
         :type concept: str
         :param context_type: specify 'instant' or 'duration'
         :type context_type: str
-        :rtype: decimal.Decimal or NoneType
+        :rtype: decimal.Decimal, float, tuple or NoneType
         :return: the concept's value or None if concept is not found
         """
         node = None
         concept_value = None
 
+        if self.facts is None:
+            self.index_facts()
+
+        key = (namespaced_tag(concept, self.ns), context)
+        if key in self.facts:
+            return self.facts[key]
+
         xpath_query = "//{concept}[@contextRef='{context}']".format(
             concept=concept,
             context=context,
@@ -477,13 +560,66 @@ class XBRLParser(object):
             nil_attribute = '{{{xsi}}}nil'.format(xsi=self.ns.get('xsi'))
             nil = node.attrib.get(nil_attribute)
 
+            decode = VALUE_DECODERS[self.value_mode]
+
             if nil == 'true':
-                concept_value = decimal.Decimal('0')
+                concept_value = decode('0', None)
             elif node.text and nil != 'true':
-                concept_value = decimal.Decimal(node.text)
+                concept_value = decode(node.text, precision)
 
         return concept_value
             
+    def load_contexts(self):
+        """
+        Returns a dict of every context in the filing, keyed by context id
+        """
+        contexts = {}
+        context_nodes = self.instance_root.xpath(
+            '//xlmns:context',
+            namespaces=self.ns
+        )
+
+        for node in context_nodes:
+            dates = {}
+            for date_type in ['instant', 'startDate', 'endDate']:
+                date_strings = node.xpath(
+                    "xlmns:period/xlmns:{0}/text()".format(date_type),
+                    namespaces=self.ns
+                )
+                if len(date_strings):
+                    dates[date_type] = datetime.strptime(
+                        strip_newlines(date_strings[0]).strip()[:10],
+                        '%Y-%m-%d'
+                    )
+
+            context_id = node.attrib['id']
+            contexts[context_id] = Context(
+                id=context_id,
+                instant=dates.get('instant'),
+                start_date=dates.get('startDate'),
+                end_date=dates.get('endDate'),
+                dimensional=bool(len(node.xpath(
+                    './/xlmns:segment',
+                    namespaces=self.ns
+                ))),
+            )
+
+        return contexts
+
+    def freeze(self):
+        """
+        Returns an immutable XBRLSnapshot of the loaded filing
+
+        The snapshot copies the DEI fields, the context table and the fact
+        index, and keeps no reference to the lxml tree. Its search() is a
+        plain dictionary lookup, so one snapshot can be shared by many
+        threads without a lock. Only numeric facts are searchable.
+        """
+        if self.facts is None:
+            self.index_facts()
+
+        return XBRLSnapshot.from_parser(self, self.load_contexts())
+
     def check_end_date(end_date, fiscal_year_focus):
         """
         Checks validity of a filing end date and replaces it if necessary.
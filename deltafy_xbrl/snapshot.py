@@ -0,0 +1,109 @@
+from collections import namedtuple
+from deltafy_xbrl.tools import namespaced_tag
+from types import MappingProxyType
+
+# XBRLParser attributes copied into a snapshot
+DEI_FIELDS = (
+    'amendment_flag',
+    'fiscal_year_end',
+    'fiscal_period_focus',
+    'fiscal_year_focus',
+    'period_end_date',
+    'period_start_date',
+    'balance_sheet_date',
+    'document_type',
+    'cik',
+    'current_reporting_status',
+    'filer_category',
+    'registrant_name',
+    'voluntary_filers',
+    'well_known_issuer',
+    'shell_company',
+    'small_business',
+    'trading_symbols',
+    'currency',
+    'instant_context',
+    'duration_context',
+)
+
+# A context's period; instant contexts have no start/end date and vice versa
+Context = namedtuple(
+    'Context',
+    ['id', 'instant', 'start_date', 'end_date', 'dimensional']
+)
+
+
+class XBRLSnapshot(object):
+    """
+    Immutable, read-only view of a loaded filing
+
+    Created by XBRLParser.freeze(). Holds the DEI fields, a context table
+    and the numeric fact index in plain immutable structures, with no
+    reference to the lxml tree, so a single snapshot can be searched from
+    many threads at once without locking.
+    """
+    __slots__ = DEI_FIELDS + ('value_mode', 'namespaces', 'contexts', 'facts')
+
+    def __init__(self, value_mode, namespaces, contexts, facts, **dei_fields):
+        """
+        Sets every field once; DEI fields that are not given are None
+        """
+        unknown_fields = set(dei_fields) - set(DEI_FIELDS)
+        if unknown_fields:
+            raise TypeError(
+                "unknown DEI fields: {0}".format(
+                    ", ".join(sorted(unknown_fields))
+                )
+            )
+
+        for name in DEI_FIELDS:
+            object.__setattr__(self, name, dei_fields.get(name))
+        object.__setattr__(self, 'value_mode', value_mode)
+        object.__setattr__(self, 'namespaces', namespaces)
+        object.__setattr__(self, 'contexts', contexts)
+        object.__setattr__(self, 'facts', facts)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("XBRLSnapshot is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("XBRLSnapshot is read-only")
+
+    def search(self, concept, context):
+        """
+        Looks up a numeric concept value within a specific context
+
+        Returns the same value as XBRLParser.search() for every fact in the
+        fact index. Facts that are not in the index (non-numeric facts,
+        fraction items, values that could not be decoded) and concepts with
+        an unknown prefix return None here, while XBRLParser.search() falls
+        back to querying the instance document for them and may return a
+        value or raise an exception.
+
+        :param concept: a prefixed accounting concept (e.g. us-gaap:Cash)
+        :type concept: str
+        :param context: a context id (e.g. snapshot.instant_context)
+        :type context: str
+        :rtype: decimal.Decimal, float, tuple or NoneType
+        :return: the concept's value or None if concept is not found
+        """
+        return self.facts.get(
+            (namespaced_tag(concept, self.namespaces), context)
+        )
+
+    @classmethod
+    def from_parser(cls, parser, contexts):
+        """
+        Builds a snapshot from an XBRLParser and its parsed context table
+        """
+        fields = {name: getattr(parser, name, None) for name in DEI_FIELDS}
+        if fields['trading_symbols'] is not None:
+            fields['trading_symbols'] = tuple(fields['trading_symbols'])
+
+        return cls(
+            value_mode=parser.value_mode,
+            namespaces=MappingProxyType(dict(parser.ns)),
+            contexts=MappingProxyType(dict(contexts)),
+            facts=MappingProxyType(dict(parser.facts)),
+            **fields
+        )
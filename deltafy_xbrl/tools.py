@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+import decimal
 
 def delta_days(start_date_string, end_date_string):
     """ 
@@ -85,3 +86,145 @@ def check_fiscal_year_focus(fiscal_year_focus, start_date, end_date):
 
     return fiscal_year_focus
 
+def namespaced_tag(concept, namespaces):
+    """
+    Translates a prefixed concept (us-gaap:Cash) into an lxml element tag
+
+    The prefix is resolved through the given namespace map, just as it is in
+    an XPath query, giving '{namespace}localname'. Returns None if the prefix
+    is not in the map.
+    """
+    prefix, _, localname = concept.rpartition(':')
+    if not prefix:
+        return localname
+
+    namespace = namespaces.get(prefix)
+    if namespace is None:
+        return None
+    return '{{{0}}}{1}'.format(namespace, localname)
+
+def decode_decimal(value_string, precision):
+    """
+    Decodes a fact value string as a decimal.Decimal
+    """
+    return decimal.Decimal(value_string)
+
+def decode_float(value_string, precision):
+    """
+    Decodes a fact value string as a float
+    """
+    return float(value_string)
+
+def decode_scaled_int(value_string, precision):
+    """
+    Decodes a fact value string as a (mantissa, exponent) pair of ints
+
+    The value is mantissa * 10**exponent. The exponent is derived from the
+    fact's 'decimals' attribute, so facts that share a 'decimals' value
+    share an exponent: '5000000' with decimals='-6' becomes (5, 6) and
+    '12.5' with decimals='2' becomes (1250, -2). The exponent written in
+    the value string is kept instead when the value has more digits than
+    'decimals' allows, when scaling would push the mantissa out of the
+    int64 range, or when 'decimals' is 'INF', missing, malformed or outside
+    +/-DECIMALS_LIMIT. The result is always exact.
+
+    Raises ValueError for values that are not finite numbers (INF, NaN).
+    """
+    try:
+        target_exponent, zeros = DECIMALS_SCALES[precision]
+    except KeyError:
+        target_exponent, zeros = decimals_scale(precision)
+
+    if zeros:
+        # The common case: an integer rounded to decimals='-3', '-6', ...
+        text = value_string.strip()
+        if text.endswith(zeros):
+            try:
+                return int(text[:-target_exponent]), target_exponent
+            except ValueError:
+                pass
+
+    # Anything but a plain xs:decimal lexical value (e.g. 1.5E3 in a double
+    # fact, or stray whitespace after the fraction) goes through Decimal
+    whole, _, fraction = value_string.partition('.')
+    if fraction.isdigit() or not fraction:
+        try:
+            mantissa = int(whole + fraction)
+        except ValueError:
+            mantissa, exponent = decode_scientific(value_string)
+        else:
+            exponent = -len(fraction)
+    else:
+        mantissa, exponent = decode_scientific(value_string)
+
+    if target_exponent is None or target_exponent == exponent:
+        return mantissa, exponent
+
+    scale = abs(target_exponent - exponent)
+    if scale > DECIMALS_LIMIT:
+        return mantissa, exponent
+
+    if target_exponent < exponent:
+        # Scaling to a finer exponent is exact, but must stay within int64
+        scaled_mantissa = mantissa * 10 ** scale
+        if -INT64_LIMIT <= scaled_mantissa < INT64_LIMIT:
+            return scaled_mantissa, target_exponent
+        return mantissa, exponent
+
+    quotient, remainder = divmod(mantissa, 10 ** scale)
+    if remainder:
+        return mantissa, exponent
+    return quotient, target_exponent
+
+def decode_scientific(value_string):
+    """
+    Returns the (mantissa, exponent) pair of any finite decimal string
+
+    Raises ValueError for INF and NaN, which have no such representation.
+    """
+    value = decimal.Decimal(value_string)
+    if not value.is_finite():
+        raise ValueError(
+            "{0!r} cannot be represented as a scaled integer".format(
+                value_string
+            )
+        )
+
+    sign, digits, exponent = value.as_tuple()
+    mantissa = int(''.join(map(str, digits)))
+    if sign:
+        mantissa = -mantissa
+
+    return mantissa, exponent
+
+def decimals_scale(precision):
+    """
+    Returns the (exponent, zeros) pair implied by a 'decimals' attribute
+
+    zeros is the string of trailing zeros that a value rounded to a positive
+    exponent ends with (e.g. '000' for decimals='-3'), or None. The exponent
+    is None for decimals='INF' and for missing, malformed or out of range
+    values.
+    """
+    try:
+        exponent = -int(precision)
+    except (TypeError, ValueError):
+        return None, None
+
+    if not -DECIMALS_LIMIT <= exponent <= DECIMALS_LIMIT:
+        return None, None
+    if exponent > 0:
+        return exponent, '0' * exponent
+    return exponent, None
+
+# Mantissas are kept within the int64 range, [-2**63, 2**63)
+INT64_LIMIT = 2 ** 63
+
+# Largest 'decimals' magnitude honoured; an int64 holds 18 full digits
+DECIMALS_LIMIT = 18
+
+# decimals_scale() results for the most common 'decimals' attribute values
+DECIMALS_SCALES = {
+    precision: decimals_scale(precision)
+    for precision in [str(d) for d in range(-12, 13)] + ['INF', None]
+}
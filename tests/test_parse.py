@@ -0,0 +1,84 @@
+import decimal
+import os
+import unittest
+
+from deltafy_xbrl.parse import XBRLParser
+
+FILING = os.path.join(os.path.dirname(__file__), 'data', 'xyz-20161231.xml')
+
+
+class XBRLParserTest(unittest.TestCase):
+
+    def test_loads_in_every_value_mode(self):
+        for value_mode in ['decimal', 'float', 'scaled_int']:
+            parser = XBRLParser(FILING, value_mode=value_mode)
+            self.assertEqual(parser.registrant_name, 'XYZ Corp.')
+            self.assertEqual(parser.instant_context, 'I2016')
+            self.assertEqual(parser.duration_context, 'D2016')
+            self.assertEqual(parser.currency, 'usd')
+
+    def test_rejects_unknown_value_mode(self):
+        with self.assertRaises(ValueError):
+            XBRLParser(FILING, value_mode='int')
+
+    def test_search_values(self):
+        expected = {
+            'decimal': [decimal.Decimal('10000000'), decimal.Decimal('1.2')],
+            'float': [10000000.0, 1.2],
+            'scaled_int': [(10, 6), (120, -2)],
+        }
+        for value_mode, values in expected.items():
+            parser = XBRLParser(FILING, value_mode=value_mode)
+            self.assertEqual([
+                parser.search('us-gaap:Cash', 'I2016'),
+                parser.search('us-gaap:EarningsPerShareBasic', 'D2016'),
+            ], values)
+
+    def test_search_nil_and_missing(self):
+        parser = XBRLParser(FILING)
+        self.assertEqual(
+            parser.search('us-gaap:Goodwill', 'I2016'),
+            decimal.Decimal('0')
+        )
+        self.assertIsNone(parser.search('us-gaap:Liabilities', 'I2016'))
+
+    def test_undecodable_facts_fail_only_when_searched(self):
+        parser = XBRLParser(FILING, value_mode='scaled_int')
+        with self.assertRaises(ArithmeticError):
+            parser.search('abc:Frac', 'D2016')
+        with self.assertRaises(ValueError):
+            parser.search('abc:Ratio', 'D2016')
+
+    def test_index_is_built_on_first_search(self):
+        parser = XBRLParser(FILING)
+        self.assertIsNone(parser.facts)
+        parser.search('us-gaap:Cash', 'I2016')
+        self.assertIn(
+            ('{http://fasb.org/us-gaap/2014-01-31}Cash', 'I2016'),
+            parser.facts
+        )
+
+    def test_search_returns_first_fact_like_xpath(self):
+        # The first us-gaap:Revenues fact has no unitRef; a later duplicate
+        # with one must not take its place
+        for value_mode, value in [('decimal', decimal.Decimal('999')),
+                                  ('scaled_int', (999, 0))]:
+            parser = XBRLParser(FILING, value_mode=value_mode)
+            self.assertEqual(parser.search('us-gaap:Revenues', 'D2016'), value)
+
+    def test_out_of_range_decimals_keep_written_exponent(self):
+        parser = XBRLParser(FILING, value_mode='scaled_int')
+        self.assertEqual(parser.search('abc:Huge', 'D2016'), (7000, 0))
+
+    def test_search_resolves_prefixes_like_xpath(self):
+        # abc:Revenues is declared twice: once under a locally re-bound
+        # 'abc' prefix and once in a default namespace matching the root's
+        parser = XBRLParser(FILING)
+        self.assertEqual(
+            parser.search('abc:Revenues', 'D2016'),
+            decimal.Decimal('5000')
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
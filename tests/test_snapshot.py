@@ -0,0 +1,83 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from deltafy_xbrl.parse import XBRLParser
+
+FILING = os.path.join(os.path.dirname(__file__), 'data', 'xyz-20161231.xml')
+
+QUERIES = [
+    ('us-gaap:Cash', 'I2016'),
+    ('us-gaap:Cash', 'I2016_Segment'),
+    ('us-gaap:Assets', 'I2016'),
+    ('us-gaap:EarningsPerShareBasic', 'D2016'),
+    ('us-gaap:Goodwill', 'I2016'),
+    ('us-gaap:Liabilities', 'I2016'),
+    ('abc:Revenues', 'D2016'),
+    ('abc:Rate', 'D2016'),
+]
+
+
+class XBRLSnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = XBRLParser(FILING, value_mode='scaled_int')
+        self.snapshot = self.parser.freeze()
+
+    def test_dei_fields(self):
+        self.assertEqual(self.snapshot.registrant_name, 'XYZ Corp.')
+        self.assertEqual(self.snapshot.document_type, '10-K')
+        self.assertEqual(self.snapshot.trading_symbols, ('xyz',))
+        self.assertEqual(self.snapshot.instant_context, 'I2016')
+        self.assertEqual(self.snapshot.duration_context, 'D2016')
+
+    def test_contexts(self):
+        contexts = self.snapshot.contexts
+        self.assertEqual(len(contexts), 3)
+        self.assertIsNone(contexts['D2016'].instant)
+        self.assertEqual(contexts['D2016'].start_date.month, 1)
+        self.assertFalse(contexts['I2016'].dimensional)
+        self.assertTrue(contexts['I2016_Segment'].dimensional)
+
+    def test_search_matches_parser(self):
+        for concept, context in QUERIES:
+            self.assertEqual(
+                self.snapshot.search(concept, context),
+                self.parser.search(concept, context),
+            )
+
+    def test_search_outside_fact_index_returns_none(self):
+        self.assertIsNone(self.snapshot.search('abc:Frac', 'D2016'))
+        self.assertIsNone(self.snapshot.search('abc:Ratio', 'D2016'))
+        self.assertIsNone(self.snapshot.search('xyz:Cash', 'I2016'))
+
+    def test_read_only(self):
+        with self.assertRaises(AttributeError):
+            self.snapshot.cik = '0000000002'
+        with self.assertRaises(TypeError):
+            self.snapshot.facts[('Cash', 'I2016')] = (1, 0)
+        with self.assertRaises(TypeError):
+            del self.snapshot.contexts['I2016']
+
+    def test_not_a_tuple(self):
+        self.assertNotIsInstance(self.snapshot, tuple)
+        with self.assertRaises(TypeError):
+            len(self.snapshot)
+        with self.assertRaises(AttributeError):
+            del self.snapshot.facts
+        self.assertEqual(hash(self.snapshot), hash(self.snapshot))
+
+    def test_concurrent_search(self):
+        expected = [self.snapshot.search(*query) for query in QUERIES]
+
+        def worker():
+            return [self.snapshot.search(*query) for query in QUERIES * 100]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(worker) for _ in range(8)]
+            for future in futures:
+                self.assertEqual(future.result(), expected * 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
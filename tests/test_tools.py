@@ -0,0 +1,106 @@
+import unittest
+
+from deltafy_xbrl.tools import decode_scaled_int
+
+
+class DecodeScaledIntTest(unittest.TestCase):
+
+    def test_sign(self):
+        self.assertEqual(decode_scaled_int('1500', 'INF'), (1500, 0))
+        self.assertEqual(decode_scaled_int('-1500', 'INF'), (-1500, 0))
+        self.assertEqual(decode_scaled_int('+1500', 'INF'), (1500, 0))
+        self.assertEqual(decode_scaled_int('-0.25', 'INF'), (-25, -2))
+        self.assertEqual(decode_scaled_int('-.5', 'INF'), (-5, -1))
+
+    def test_fraction(self):
+        self.assertEqual(decode_scaled_int('12.34', 'INF'), (1234, -2))
+        self.assertEqual(decode_scaled_int('12.340', 'INF'), (12340, -3))
+        self.assertEqual(decode_scaled_int('12.', 'INF'), (12, 0))
+        self.assertEqual(decode_scaled_int('0.001', None), (1, -3))
+
+    def test_exponent_notation(self):
+        self.assertEqual(decode_scaled_int('1.5E3', 'INF'), (15, 2))
+        self.assertEqual(decode_scaled_int('-2e-2', 'INF'), (-2, -2))
+        self.assertEqual(decode_scaled_int('1.5E3', '0'), (1500, 0))
+
+    def test_whitespace(self):
+        self.assertEqual(decode_scaled_int(' 1000\n', '-3'), (1, 3))
+        self.assertEqual(decode_scaled_int('1.5 ', '2'), (150, -2))
+
+    def test_negative_decimals(self):
+        self.assertEqual(decode_scaled_int('5000000', '-6'), (5, 6))
+        self.assertEqual(decode_scaled_int('-1234000', '-3'), (-1234, 3))
+        self.assertEqual(decode_scaled_int('0', '-3'), (0, 3))
+
+    def test_negative_decimals_keeps_unrounded_digits(self):
+        self.assertEqual(decode_scaled_int('1234567', '-3'), (1234567, 0))
+        self.assertEqual(decode_scaled_int('-1234567', '-3'), (-1234567, 0))
+        self.assertEqual(decode_scaled_int('1000.5', '-3'), (10005, -1))
+
+    def test_positive_decimals_scales_up(self):
+        self.assertEqual(decode_scaled_int('12.5', '2'), (1250, -2))
+        self.assertEqual(decode_scaled_int('12', '2'), (1200, -2))
+        self.assertEqual(decode_scaled_int('12.50', '2'), (1250, -2))
+
+    def test_positive_decimals_keeps_extra_digits(self):
+        self.assertEqual(decode_scaled_int('12.505', '2'), (12505, -3))
+        self.assertEqual(decode_scaled_int('12.500', '2'), (1250, -2))
+
+    def test_zero_decimals(self):
+        self.assertEqual(decode_scaled_int('123456', '0'), (123456, 0))
+        self.assertEqual(decode_scaled_int('2.0', '0'), (2, 0))
+
+    def test_unusual_decimals(self):
+        self.assertEqual(decode_scaled_int('5' + '0' * 15, '-15'), (5, 15))
+        self.assertEqual(decode_scaled_int('1.5', '18'), (15 * 10 ** 17, -18))
+        self.assertEqual(decode_scaled_int('000', '-3'), (0, 3))
+        self.assertEqual(decode_scaled_int('-000', '-3'), (0, 3))
+
+    def test_out_of_range_decimals(self):
+        self.assertEqual(decode_scaled_int('1.5', '19'), (15, -1))
+        self.assertEqual(decode_scaled_int('5000', '-19'), (5000, 0))
+        self.assertEqual(decode_scaled_int('5000', '-10000000'), (5000, 0))
+        self.assertEqual(decode_scaled_int('1.5', '10000000'), (15, -1))
+        self.assertEqual(decode_scaled_int('5000', '-' + '9' * 5000), (5000, 0))
+
+    def test_exponent_far_from_decimals(self):
+        self.assertEqual(decode_scaled_int('1E-1000000', '-3'), (1, -1000000))
+        self.assertEqual(decode_scaled_int('1E+1000000', '2'), (1, 1000000))
+
+    def test_scaling_up_stays_within_int64(self):
+        self.assertEqual(
+            decode_scaled_int('9223372036854775.807', '3'),
+            (9223372036854775807, -3)
+        )
+        self.assertEqual(
+            decode_scaled_int('9223372036854775.807', '4'),
+            (9223372036854775807, -3)
+        )
+        self.assertEqual(
+            decode_scaled_int('-92233720368547758.08', '2'),
+            (-9223372036854775808, -2)
+        )
+        self.assertEqual(
+            decode_scaled_int('-92233720368547758.08', '3'),
+            (-9223372036854775808, -2)
+        )
+        self.assertEqual(decode_scaled_int('123456789', '12'), (123456789, 0))
+
+    def test_missing_or_malformed_decimals(self):
+        for precision in [None, 'INF', '', 'abc', '1.5']:
+            self.assertEqual(decode_scaled_int('1000', precision), (1000, 0))
+            self.assertEqual(decode_scaled_int('1.50', precision), (150, -2))
+
+    def test_non_finite_values(self):
+        for value_string in ['INF', '-INF', 'NaN']:
+            with self.assertRaises(ValueError):
+                decode_scaled_int(value_string, 'INF')
+
+    def test_invalid_values(self):
+        for value_string in ['', 'abc', '1.2.3']:
+            with self.assertRaises((ValueError, ArithmeticError)):
+                decode_scaled_int(value_string, '-3')
+
+
+if __name__ == '__main__':
+    unittest.main()